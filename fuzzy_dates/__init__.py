@@ -1 +1,8 @@
 from .fuzzy_dates import *  # noqa
+
+
+def __getattr__(name):
+    # DATE_PATTERN is compiled lazily, so the star import above doesn't pick
+    # it up; fetch it (and anything else resolved lazily) from the submodule.
+    from . import fuzzy_dates
+    return getattr(fuzzy_dates, name)
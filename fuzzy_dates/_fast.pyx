@@ -0,0 +1,44 @@
+# cython: language_level=3
+# Optional compiled parser for fuzzy date strings. This mirrors
+# "_parse_date_string()" in fuzzy_dates.py, checking the three legal shapes
+# (yyyy, yyyy?mm, yyyy?mm?dd with "?" one of "-", ".", "/") with pointer
+# arithmetic instead of Python-level slicing. The extension is not built by
+# default; fuzzy_dates.py falls back to the pure-Python parser when it is
+# absent. Unlike the Python parser, this one only accepts ASCII digits.
+
+
+cdef inline bint _is_sep(unsigned char c) nogil:
+    return c == c'-' or c == c'.' or c == c'/'
+
+
+cdef inline bint _all_digits(const unsigned char *s, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        if s[i] < c'0' or s[i] > c'9':
+            return False
+    return True
+
+
+def parse(str s):
+    cdef bytes encoded
+    cdef const unsigned char *p
+    cdef Py_ssize_t length
+
+    try:
+        encoded = s.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Dates given as a string must be formatted as yyyy, yyyy.mm, or yyyy.mm.dd")
+
+    p = encoded
+    length = len(encoded)
+
+    if length == 4 and _all_digits(p, 0, 4):
+        return s, None, None
+    if length == 7 and _is_sep(p[4]) and _all_digits(p, 0, 4) and _all_digits(p, 5, 7):
+        return s[:4], s[5:7], None
+    if length == 10 and (
+        _is_sep(p[4]) and _is_sep(p[7])
+        and _all_digits(p, 0, 4) and _all_digits(p, 5, 7) and _all_digits(p, 8, 10)
+    ):
+        return s[:4], s[5:7], s[8:10]
+    raise ValueError("Dates given as a string must be formatted as yyyy, yyyy.mm, or yyyy.mm.dd")
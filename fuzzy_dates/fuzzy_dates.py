@@ -1,4 +1,6 @@
 import calendar
+import copy
+import functools
 import re
 from datetime import date, datetime
 from django import forms
@@ -10,7 +12,21 @@ from django.db import models
 # This regex matches dates in the format yyyy, yyyy.mm, or yyyy.mm.dd (other
 # separators are allowed, too, e.g., yyyy-mm-dd or yyyy/mm/dd). Thanks to
 # https://stackoverflow.com/questions/15474741/python-regex-optional-capture-group
-DATE_PATTERN = re.compile(r"(\d{4})(?:[.\-/](\d{2})(?:[.\-/](\d{2}))?)?$")
+# Parsing now goes through "_parse_date_string()" below, which is faster, but
+# the pattern is kept in case external code relies on it. It is compiled
+# lazily (see "__getattr__()" at the bottom of this module) so that merely
+# importing the module doesn't pay the re.compile cost.
+_DATE_PATTERN_SOURCE = r"(\d{4})(?:[.\-/](\d{2})(?:[.\-/](\d{2}))?)?$"
+_date_pattern = None
+
+
+def _get_date_pattern():
+    global _date_pattern
+    if _date_pattern is None:
+        _date_pattern = re.compile(_DATE_PATTERN_SOURCE)
+    return _date_pattern
+
+
 DATE_FIELD_ORDER = getattr(settings, "FUZZY_DATE_FIELD_ORDER", "mdy").lower()
 DATE_FIELD_SEPARATOR = getattr(settings, "FUZZY_DATE_FIELD_SEPARATOR", "/")
 DATE_FIELD_PLACEHOLDERS = {
@@ -24,6 +40,59 @@ DATE_FIELD_REQUIRED = {
     "d": False,
 }
 TRIM_CHAR = "0" if getattr(settings, "FUZZY_DATE_TRIM_LEADING_ZEROS", False) else ""
+SEPARATOR_CHARS = ("-", ".", "/")
+
+
+# The only legal string shapes are yyyy, yyyy?mm, and yyyy?mm?dd (where "?" is
+# one of the separators above), so a length check plus slicing covers every
+# case more cheaply than running the regex engine. Only ASCII digits are
+# accepted: isdigit() alone would let through characters like superscripts
+# that int() can't convert, and the compiled parser in _fast.pyx is
+# ASCII-only, so this keeps the two parsers in agreement.
+def _parse_date_string(s):
+    if not isinstance(s, str):
+        # Match the compiled parser (and the old regex), which only accept
+        # strings.
+        raise TypeError("expected string, got {!r}".format(s))
+    length = len(s)
+    if length == 4 and s.isascii() and s.isdigit():
+        return s, None, None
+    if length == 7 and (
+        s.isascii() and s[4] in SEPARATOR_CHARS
+        and s[:4].isdigit() and s[5:7].isdigit()
+    ):
+        return s[:4], s[5:7], None
+    if length == 10 and (
+        s.isascii() and s[4] in SEPARATOR_CHARS and s[7] in SEPARATOR_CHARS
+        and s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()
+    ):
+        return s[:4], s[5:7], s[8:10]
+    raise ValueError("Dates given as a string must be formatted as yyyy, yyyy.mm, or yyyy.mm.dd")
+
+
+# A Cython version of the parser above (see fuzzy_dates/_fast.pyx) does the
+# same checks with pointer arithmetic. The extension is not built as part of
+# the default packaging, but when it has been compiled it takes over here.
+# See "Optional Compiled Parser" in the README for build instructions.
+try:
+    from ._fast import parse as _parse_date_string  # noqa: F811
+except ImportError:
+    pass
+
+
+# Zero-pad a month or day string to two characters. This avoids the format
+# spec machinery behind f"{s:>02}", which is measurably slower for strings
+# that are already one or two characters long.
+def _pad2(s):
+    return s if len(s) == 2 else ("0" + s)[-2:]
+
+
+# The last day of a month is a pure function of (year, month), and a typical
+# app only ever sees a small set of distinct pairs, so caching turns the
+# monthrange() arithmetic into a dict lookup.
+@functools.lru_cache(maxsize=2048)
+def _last_day(year, month):
+    return calendar.monthrange(year, month)[1]
 
 
 if len(DATE_FIELD_ORDER) != 3 or set(DATE_FIELD_ORDER) != set("ymd"):
@@ -32,27 +101,46 @@ if len(DATE_FIELD_ORDER) != 3 or set(DATE_FIELD_ORDER) != set("ymd"):
 if DATE_FIELD_SEPARATOR not in ("-", ".", "/"):
     raise ValueError("The FUZZY_DATE_FIELD_SEPARATOR setting must be one of '-', '.', or '/'.")
 
+# Indices into a (year, month, day) tuple, in the user's preferred display
+# order. Precomputed so that __str__ and decompress, which run once per
+# rendered object, don't have to rebuild a dict on every call. The order,
+# placeholder, and required-flag tuples below are likewise precomputed so
+# that widget and form field construction doesn't repeat the dict lookups.
+_ORDER_IDX = tuple("ymd".index(c) for c in DATE_FIELD_ORDER)
+_ORDER_TUPLE = tuple(DATE_FIELD_ORDER)
+_FIELD_PLACEHOLDERS = tuple(DATE_FIELD_PLACEHOLDERS[el] for el in _ORDER_TUPLE)
+_FIELD_REQUIRED = tuple(DATE_FIELD_REQUIRED[el] for el in _ORDER_TUPLE)
 
-# We use a custom metaclass to normalize parameters before they are passed to
-# the class's "__new__()" and "__init__()" methods.  It also allows FuzzyDate
-# instances to be initialized either with a string or via keyword arguments.
-class CustomMeta(type):
-    def __call__(cls, seed=None, *args, **kwargs):
+
+# All dates are stored in the DB as strings formatted as "yyyy.mm.dd". Using
+# this format means that comparing and sorting dates is as easy as comparing
+# and sorting strings. For fuzzy dates (e.g., just a year or just a year and
+# a month), we use a value of "00" in place of the missing month and/or day.
+# Fuzzy dates can then be sorted with non-fuzzy dates.
+#
+# Instances can be initialized either with a string, a date, or a datetime,
+# or via the "y", "m", and "d" keyword arguments. All of the normalization
+# and validation happens here in "__new__()" so that constructing an
+# instance costs a single call frame and a single allocation.
+class FuzzyDate(str):
+    # Slots instead of a per-instance __dict__: loading thousands of rows
+    # would otherwise spend far more memory on the attribute dicts than on
+    # the string data itself.
+    __slots__ = ("year", "month", "day", "is_fuzzy")
+
+    def __new__(cls, seed=None, *, y=None, m=None, d=None):
         if seed:
             if isinstance(seed, str):
-                if m := DATE_PATTERN.match(seed):
-                    year, month, day = m.groups()
-                else:
-                    raise ValueError("Dates given as a string must be formatted as yyyy, yyyy.mm, or yyyy.mm.dd")
+                year, month, day = _parse_date_string(seed)
             elif isinstance(seed, date) or isinstance(seed, datetime):
                 year, month, day = seed.year, seed.month, seed.day
             else:
                 raise TypeError("Only a string, a date, or a datetime can be passed as an initialization argument")
         else:
             # These could be strings, ints, or None at this point
-            year = kwargs.get("y")
-            month = kwargs.get("m")
-            day = kwargs.get("d")
+            year = y
+            month = m
+            day = d
 
         if not year:
             raise ValueError("Year must be specified")
@@ -64,50 +152,90 @@ class CustomMeta(type):
         month = month or fuzzy_value
         day = day or fuzzy_value
 
-        try:
-            # Check that values are valid, replacing any fuzzy values with 1. This
-            # lets us eliminate invalid dates like 2000.13.01 or 2000.01.32.
-            int_year = int(year)
-            int_month = int(month) if month != fuzzy_value else 1
-            int_day = int(day) if day != fuzzy_value else 1
-            if int_year < 1000 or int_year > 9999:
-                # Keep the year within this range as years outside it would break
-                # sorting (e.g., "900" > "1000" alphanumerically speaking). Later
-                # on I might try to relax this restriction by padding short years
-                # with zeros, but it would take some doing.
-                raise ValueError("The year must be no less than 1000 and no greater than 9999.")
-            # else
-            date(year=int_year, month=int_month, day=int_day)
-        except ValueError as e:
-            raise e
-
-        kwargs = {"y": f"{year}", "m": f"{month:>02}", "d": f"{day:>02}"}
-        return super().__call__(*args, **kwargs)
-
-
-# All dates are stored in the DB as strings formatted as "yyyy.mm.dd". Using
-# this format means that comparing and sorting dates is as easy as comparing
-# and sorting strings. For fuzzy dates (e.g., just a year or just a year and
-# a month), we use a value of "00" in place of the missing month and/or day.
-# Fuzzy dates can then be sorted with non-fuzzy dates.
-class FuzzyDate(str, metaclass=CustomMeta):
-    def __new__(cls, **kwargs):
-        fmt = DATE_FIELD_SEPARATOR.join(["{%s}" % v for v in DATE_FIELD_ORDER])
-        return super().__new__(cls, fmt.format(**kwargs))
-
-    def __init__(self, **kwargs):
-        self.year = kwargs["y"]
-        self.month = kwargs["m"] if kwargs["m"] != "00" else ""
-        self.day = kwargs["d"] if kwargs["d"] != "00" else ""
-        return super().__init__()
+        # Keep the year within the range 1000-9999 as years outside it would
+        # break sorting (e.g., "900" > "1000" alphanumerically speaking).
+        # Later on I might try to relax this restriction by padding short
+        # years with zeros, but it would take some doing. A year in range is
+        # exactly a string of 4 ASCII digits no less than "1000", so the
+        # whole check can be done with a string comparison (a 4-byte memcmp)
+        # rather than an int() conversion. The isascii() guard matters on
+        # the kwargs path, where the year hasn't been through the parser:
+        # non-ASCII digit lookalikes pass isdigit() but would be stored
+        # unconvertible.
+        year = f"{year}"
+        if len(year) != 4 or not year.isascii() or not year.isdigit() or year < "1000":
+            raise ValueError("The year must be no less than 1000 and no greater than 9999.")
+
+        # Check that the values form a valid date, eliminating invalid dates
+        # like 2000.13.01 or 2000.01.32. When the day is fuzzy, date(y, m, 1)
+        # can only fail on the month, so a range check on the month is enough.
+        # When the month is fuzzy too, the year check above already covers
+        # everything and the date() constructor is skipped entirely.
+        if day != fuzzy_value:
+            date(year=int(year), month=int(month), day=int(day))
+        elif month != fuzzy_value and not 1 <= int(month) <= 12:
+            raise ValueError("month must be in 1..12")
+
+        month, day = _pad2(f"{month}"), _pad2(f"{day}")
+        self = super().__new__(cls, f"{year}.{month}.{day}")
+        self.year = year
+        self.month = month if month != fuzzy_value else ""
+        self.day = day if day != fuzzy_value else ""
+        self.is_fuzzy = self.day == ""
+        return self
+
+    # Build an instance from zero-padded components that are already known
+    # to be valid (e.g., because they come from an existing instance),
+    # skipping parsing and validation entirely.
+    @classmethod
+    def _unchecked(cls, y, m, d):
+        self = str.__new__(cls, f"{y}.{m}.{d}")
+        self.year = y
+        self.month = m if m != "00" else ""
+        self.day = d if d != "00" else ""
+        self.is_fuzzy = d == "00"
+        return self
+
+    # Values loaded from the DB are guaranteed to be in the canonical
+    # "yyyy.mm.dd" form, so there is no need to run them through the full
+    # parsing and validation machinery on every row. Slicing the components
+    # out directly is much cheaper than a regex match when loading large
+    # querysets.
+    @classmethod
+    def _from_db_fast(cls, value):
+        if len(value) == 10 and value[4] == "." and value[7] == ".":
+            return cls._unchecked(value[0:4], value[5:7], value[8:10])
+        # Fall back to full parsing for anything unexpected.
+        return cls(value)
+
+    # Parse many canonical "yyyy.mm.dd" values in one pass. "arr" is a numpy
+    # array (or something coercible to one) of 10-byte strings; the return
+    # value is a (years, months, days) triple of int arrays, with 0 standing
+    # in for a fuzzy month or day. Viewing the buffer through a structured
+    # dtype and casting each field does all the work in C, avoiding a Python
+    # loop over tens of thousands of rows. Requires numpy, which is not a
+    # dependency of this package.
+    @staticmethod
+    def bulk_parse(arr):
+        import numpy
+
+        arr = numpy.ascontiguousarray(arr, dtype="S10")
+        parts = arr.view([
+            ("y", "S4"), ("sep1", "S1"), ("m", "S2"), ("sep2", "S1"), ("d", "S2"),
+        ])
+        return (
+            parts["y"].astype(numpy.int64),
+            parts["m"].astype(numpy.int64),
+            parts["d"].astype(numpy.int64),
+        )
 
     def __repr__(self):
         return "FuzzyDate({})".format(super().__repr__())
 
     def __str__(self):
-        data_dict = dict(zip("ymd", self.as_list()))
+        parts = (self.year, self.month, self.day)
         return DATE_FIELD_SEPARATOR.join(
-            [data_dict[el].lstrip(TRIM_CHAR) for el in DATE_FIELD_ORDER if data_dict[el]]
+            parts[i].lstrip(TRIM_CHAR) for i in _ORDER_IDX if parts[i]
         )
 
     def as_list(self):
@@ -133,13 +261,15 @@ class FuzzyDate(str, metaclass=CustomMeta):
         year = self.year
         month = self.month or "01"
         day = self.day or "01"
-        return FuzzyDate(y=year, m=month, d=day)
+        # The components come from self, so they are already valid and
+        # zero-padded; skip revalidation.
+        return FuzzyDate._unchecked(year, month, day)
 
     def get_end(self):
         year = self.year
         month = self.month or "12"
-        day = self.day or str(calendar.monthrange(int(year), int(month))[1])
-        return FuzzyDate(y=year, m=month, d=day)
+        day = self.day or str(_last_day(int(year), int(month)))
+        return FuzzyDate._unchecked(year, month, day)
 
     def get_range(self):
         return (
@@ -147,9 +277,180 @@ class FuzzyDate(str, metaclass=CustomMeta):
             self.get_end(),
         )
 
+
+# A compact alternative to FuzzyDate for workloads that hold very large
+# numbers of dates in memory (reports, aggregations). The whole date fits in
+# a single int: year in bits 0-13, month in bits 14-17, day in bits 18-22,
+# with 0 standing in for a fuzzy month or day as in the stored format. That
+# is one small PyLong per value instead of a 10-character str subclass plus
+# slots; the component strings and display form are built on demand.
+# FuzzyDateField returns these from the DB when created with
+# use_compact=True.
+class FuzzyDateCompact:
+    __slots__ = ("_packed",)
+
+    _YEAR_MASK = (1 << 14) - 1
+    _MONTH_SHIFT = 14
+    _MONTH_MASK = (1 << 4) - 1
+    _DAY_SHIFT = 18
+    _DAY_MASK = (1 << 5) - 1
+
+    def __init__(self, seed=None, *, y=None, m=None, d=None):
+        # Parsing and validation are delegated to FuzzyDate, so the two
+        # classes accept exactly the same inputs.
+        fd = seed if isinstance(seed, FuzzyDate) else FuzzyDate(seed, y=y, m=m, d=d)
+        self._packed = (
+            int(fd.year)
+            | (int(fd.month or 0) << self._MONTH_SHIFT)
+            | (int(fd.day or 0) << self._DAY_SHIFT)
+        )
+
+    # Pack a canonical "yyyy.mm.dd" DB value directly, mirroring
+    # FuzzyDate._from_db_fast.
+    @classmethod
+    def _from_db_fast(cls, value):
+        if len(value) == 10 and value[4] == "." and value[7] == ".":
+            self = cls.__new__(cls)
+            self._packed = (
+                int(value[0:4])
+                | (int(value[5:7]) << cls._MONTH_SHIFT)
+                | (int(value[8:10]) << cls._DAY_SHIFT)
+            )
+            return self
+        return cls(value)
+
+    @property
+    def year(self):
+        return str(self._packed & self._YEAR_MASK)
+
+    @property
+    def month(self):
+        month = (self._packed >> self._MONTH_SHIFT) & self._MONTH_MASK
+        return _pad2(str(month)) if month else ""
+
+    @property
+    def day(self):
+        day = (self._packed >> self._DAY_SHIFT) & self._DAY_MASK
+        return _pad2(str(day)) if day else ""
+
     @property
     def is_fuzzy(self):
-        return self.day == ""
+        return (self._packed >> self._DAY_SHIFT) & self._DAY_MASK == 0
+
+    def as_fuzzy_date(self):
+        month = (self._packed >> self._MONTH_SHIFT) & self._MONTH_MASK
+        day = (self._packed >> self._DAY_SHIFT) & self._DAY_MASK
+        return FuzzyDate._unchecked(self.year, _pad2(str(month)), _pad2(str(day)))
+
+    def __eq__(self, other):
+        if isinstance(other, FuzzyDateCompact):
+            return self._packed == other._packed
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._packed)
+
+    def __repr__(self):
+        month = (self._packed >> self._MONTH_SHIFT) & self._MONTH_MASK
+        day = (self._packed >> self._DAY_SHIFT) & self._DAY_MASK
+        return "FuzzyDateCompact('{}.{}.{}')".format(
+            self.year, _pad2(str(month)), _pad2(str(day))
+        )
+
+    def __str__(self):
+        parts = (self.year, self.month, self.day)
+        return DATE_FIELD_SEPARATOR.join(
+            parts[i].lstrip(TRIM_CHAR) for i in _ORDER_IDX if parts[i]
+        )
+
+
+# Bulk validation for ingest paths (CSV imports, data migrations) that check
+# large numbers of (year, month, day) int triples before constructing
+# FuzzyDate objects. A month or day of 0 means fuzzy, as in the stored
+# format. Returns the index of the first invalid row, or -1 if every row is
+# valid. When numba is installed and the input is large enough to repay the
+# one-off compilation, a jitted kernel does the row loop in machine code;
+# otherwise vectorized numpy checks are used. Both numba and numpy are
+# optional dependencies.
+_NUMBA_MIN_ROWS = 128
+_numba_validate_ymd = None
+
+
+def _get_numba_validate_ymd():
+    global _numba_validate_ymd
+    if _numba_validate_ymd is None:
+        import numpy
+        from numba import njit
+
+        @njit(cache=True)
+        def kernel(years, months, days):
+            month_lengths = numpy.array(
+                [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+                dtype=numpy.int64,
+            )
+            for i in range(years.shape[0]):
+                y = years[i]
+                m = months[i]
+                d = days[i]
+                if y < 1000 or y > 9999:
+                    return i
+                if m == 0:
+                    if d != 0:  # a day requires a month
+                        return i
+                    continue
+                if m < 1 or m > 12:
+                    return i
+                if d == 0:
+                    continue
+                max_d = month_lengths[m - 1]
+                if m == 2 and (y % 4 == 0) and (y % 100 != 0 or y % 400 == 0):
+                    max_d = 29
+                if d < 1 or d > max_d:
+                    return i
+            return -1
+
+        _numba_validate_ymd = kernel
+    return _numba_validate_ymd
+
+
+def _bulk_validate_ymd_numpy(years, months, days):
+    import numpy
+
+    month_lengths = numpy.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    fuzzy_month = months == 0
+    checked_months = numpy.where(fuzzy_month, 1, months)
+    valid = (years >= 1000) & (years <= 9999)
+    valid &= ~(fuzzy_month & (days != 0))  # a day requires a month
+    valid &= (checked_months >= 1) & (checked_months <= 12)
+    max_days = month_lengths[numpy.clip(checked_months, 1, 12)]
+    max_days = numpy.where((checked_months == 2) & leap, 29, max_days)
+    valid &= (days == 0) | ((days >= 1) & (days <= max_days))
+    invalid = numpy.flatnonzero(~valid)
+    return int(invalid[0]) if invalid.size else -1
+
+
+def bulk_validate_ymd(years, months, days):
+    import numpy
+
+    years = numpy.asarray(years, dtype=numpy.int64)
+    months = numpy.asarray(months, dtype=numpy.int64)
+    days = numpy.asarray(days, dtype=numpy.int64)
+    if years.shape[0] >= _NUMBA_MIN_ROWS:
+        try:
+            return int(_get_numba_validate_ymd()(years, months, days))
+        except ImportError:
+            pass
+    return _bulk_validate_ymd_numpy(years, months, days)
+
+
+# Querysets tend to repeat the same date strings (year-only values like
+# "1999.00.00" especially), and FuzzyDate is immutable, so instances can be
+# shared safely. Caching turns repeated DB loads into a dict lookup. Hit
+# rates can be inspected via "_cached_fuzzy.cache_info()".
+@functools.lru_cache(maxsize=4096)
+def _cached_fuzzy(value):
+    return FuzzyDate._from_db_fast(value)
 
 
 class FuzzyDateWidget(forms.MultiWidget):
@@ -157,18 +458,40 @@ class FuzzyDateWidget(forms.MultiWidget):
         # Define the input widgets in the user's preferred order.
         widgets = [
             forms.NumberInput(attrs={
-                "min": 1, "placeholder": DATE_FIELD_PLACEHOLDERS[el]
-            }) for el in DATE_FIELD_ORDER
+                "min": 1, "placeholder": placeholder
+            }) for placeholder in _FIELD_PLACEHOLDERS
         ]
         super().__init__(widgets, attrs)
 
     def decompress(self, value):
         if value:  # will be a FuzzyDate object
-            data_dict = dict(zip("ymd", value.as_list()))
-            return [data_dict[el] for el in DATE_FIELD_ORDER]  # rearrange to the user's preferred order
+            parts = (value.year, value.month, value.day)
+            return [parts[i] for i in _ORDER_IDX]  # rearrange to the user's preferred order
         return ["", "", ""]
 
 
+# The three IntegerFields backing FuzzyDateFormField are identical for every
+# form instance, so build them (and patch their validator messages) once and
+# hand out copies. Copying is cheaper than constructing the fields and
+# rescanning their validators each time; sharing them outright isn't safe
+# because MultiValueField mutates the fields it is given. The copies go
+# through Field.__deepcopy__, which gives each one its own error_messages
+# dict, validators list, and widget -- a shallow copy would share those with
+# the templates and let one form's customizations leak into every later one.
+@functools.lru_cache(maxsize=None)
+def _form_field_templates():
+    fields = tuple(
+        forms.IntegerField(
+            min_value=1, required=required
+        ) for required in _FIELD_REQUIRED
+    )
+    for field in fields:
+        for validator in field.validators:
+            if isinstance(validator, MinValueValidator):
+                validator.message = "Ensure all values are greater than 1."
+    return fields
+
+
 class FuzzyDateFormField(forms.MultiValueField):
 
     def __init__(self, *args, **kwargs):
@@ -178,22 +501,14 @@ class FuzzyDateFormField(forms.MultiValueField):
         for k in ("max_length", "empty_value"):
             kwargs.pop(k, None)
 
-        fields = [
-            forms.IntegerField(
-                min_value=1, required=DATE_FIELD_REQUIRED[el]
-            ) for el in DATE_FIELD_ORDER
-        ]
+        fields = [copy.deepcopy(field) for field in _form_field_templates()]
         kwargs["require_all_fields"] = False
         super().__init__(fields, *args, **kwargs)
         self.widget = FuzzyDateWidget()
-        for field in fields:
-            for validator in field.validators:
-                if isinstance(validator, MinValueValidator):
-                    validator.message = "Ensure all values are greater than 1."
 
     def compress(self, data_list):
         if data_list:
-            data_dict = dict(zip(DATE_FIELD_ORDER, data_list))
+            data_dict = dict(zip(_ORDER_TUPLE, data_list))
             try:
                 return FuzzyDate(**data_dict)
             except ValueError as e:
@@ -203,29 +518,80 @@ class FuzzyDateFormField(forms.MultiValueField):
 
 class FuzzyDateField(models.CharField):
 
-    def __init__(self, *args, **kwargs):
+    # With use_compact=True, values loaded from the DB are returned as
+    # FuzzyDateCompact instances instead of FuzzyDate ones, trading the
+    # richer str interface for a much smaller memory footprint.
+    def __init__(self, *args, use_compact=False, **kwargs):
         kwargs["max_length"] = 10
+        self.use_compact = use_compact
         super().__init__(*args, **kwargs)
 
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.use_compact:
+            kwargs["use_compact"] = True
+        return name, path, args, kwargs
+
     def formfield(self, **kwargs):
         kwargs.update({"form_class": FuzzyDateFormField})
         return super().formfield(**kwargs)
 
+    # Bulk counterpart to from_db_value for report/export code that pulls
+    # large numbers of raw values (e.g., via values_list): parses all of
+    # them vectorized in one call. See FuzzyDate.bulk_parse for the return
+    # format; requires numpy.
+    def bulk_from_db(self, values):
+        return FuzzyDate.bulk_parse(values)
+
     def from_db_value(self, value, expression, connection):
         if value:
             # Values coming from the DB should be in the format yyyy.mm.dd
-            return FuzzyDate(value)
+            if self.use_compact:
+                return FuzzyDateCompact._from_db_fast(value)
+            return _cached_fuzzy(value)
         # else
         return value
 
     def to_python(self, value):
+        if isinstance(value, FuzzyDateCompact):
+            # Unpack to the canonical string form, e.g. for saving.
+            return value.as_fuzzy_date()
         if value and not isinstance(value, FuzzyDate):
-            try:
-                if m := DATE_PATTERN.match(value):
-                    y, m, d = m.groups()
-                    value = FuzzyDate(y=y, m=m, d=d)
+            # Fast path for strings already in the canonical yyyy.mm.dd form
+            # (with "00" standing in for a fuzzy month or day). to_python is
+            # the validation hook for anything assigned to the model
+            # attribute, so the range checks still happen -- they are just
+            # done with cheap string compares and a cached month-length
+            # lookup instead of the full construction path. Anything that
+            # fails them falls through to the slow path below, which raises
+            # the appropriate error.
+            if (
+                isinstance(value, str) and len(value) == 10 and value.isascii()
+                and value[4] == "." and value[7] == "."
+                and value[:4].isdigit() and value[5:7].isdigit() and value[8:10].isdigit()
+            ):
+                year, month, day = value[:4], value[5:7], value[8:10]
+                if month == "00":
+                    valid = day == "00"
+                elif "01" <= month <= "12":
+                    valid = day == "00" or 1 <= int(day) <= _last_day(int(year), int(month))
                 else:
-                    raise ValidationError("Date strings must be formatted as 'yyyy', 'yyyy.mm', or 'yyyy.mm.dd'")
+                    valid = False
+                if valid and year >= "1000":
+                    return FuzzyDate._unchecked(year, month, day)
+            try:
+                y, m, d = _parse_date_string(value)
+            except (TypeError, ValueError):
+                # TypeError covers non-string input (e.g., a date or an int).
+                raise ValidationError("Date strings must be formatted as 'yyyy', 'yyyy.mm', or 'yyyy.mm.dd'")
+            try:
+                value = FuzzyDate(y=y, m=m, d=d)
             except TypeError as e:
                 raise ValidationError(e)
         return value
+
+
+def __getattr__(name):
+    if name == "DATE_PATTERN":
+        return _get_date_pattern()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")